@@ -1,23 +1,141 @@
 import sys
+import functools
+from collections import namedtuple
 import numpy as np
 import psychrolib
+import matplotlib
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QDoubleSpinBox, QGroupBox, QTextEdit, QPushButton,
                              QFileDialog)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 
 # Initialisation de la bibliothèque scientifique (Système SI)
 psychrolib.SetUnitSystem(psychrolib.SI)
 
-def pression_from_altitude(h_m: float) -> float:
+# Rendu interactif allégé (simplification des tracés, découpage des longs chemins Agg)
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
+# Versions vectorisées des fonctions psychrolib (appel unique sur des tableaux numpy)
+sat_hum_ratio = np.vectorize(psychrolib.GetSatHumRatio, otypes=[float])
+hum_ratio_from_rel_hum = np.vectorize(psychrolib.GetHumRatioFromRelHum, otypes=[float])
+t_from_volume_and_hum_ratio = np.vectorize(psychrolib.GetTDryBulbFromMoistAirVolumeAndHumRatio, otypes=[float])
+
+def pression_from_altitude(h_m: "float | np.ndarray") -> "float | np.ndarray":
     """Calcule la pression atmosphérique (Pa) à partir de l'altitude en mètres.
-    Formule ICAO : P = P0 × (1 - h/44330)^5.255"""
-    p0 = 101325  # Pa au niveau de la mer
-    h = max(0, min(h_m, 44330))  # Limite physique
-    return p0 * (1 - h / 44330) ** 5.255
+    Formule ICAO : P = P0 × (1 - h/44330)^5.255
+    Accepte un scalaire (renvoie un scalaire) ou un tableau d'altitudes."""
+    p0 = 101325.0  # Pa au niveau de la mer
+    h = np.clip(np.asarray(h_m, dtype=np.float64), 0.0, 44330.0)  # Limite physique
+    return p0 * (1.0 - h / 44330.0) ** 5.255
+
+def _valid_interval(x, margin):
+    """Intervalle [x0, x1] (x croissant) où margin >= 0, bornes interpolées linéairement
+    entre échantillons. margin doit être positive sur un seul intervalle ; None si vide."""
+    idx = np.flatnonzero(margin >= 0)
+    if idx.size == 0:
+        return None
+    i0, i1 = idx[0], idx[-1]
+    x0 = x[i0] if i0 == 0 else np.interp(0, margin[[i0 - 1, i0]], x[[i0 - 1, i0]])
+    x1 = x[i1] if i1 == len(x) - 1 else np.interp(0, margin[[i1 + 1, i1]], x[[i1 + 1, i1]])
+    return x0, x1
+
+# Points par courbe d'enthalpie / de volume : quasi rectilignes, tracées entre bornes exactes
+N_PTS_COURBE = 20
+
+ChartGrids = namedtuple('ChartGrids', ['temps', 'w_sat', 'iso_w', 'hr_curves', 'isotherms',
+                                       'enthalpy_curves', 'volume_curves'])
+
+@functools.lru_cache(maxsize=16)
+def _compute_chart_grids(p_atm: int) -> ChartGrids:
+    """Calcule les courbes du fond de diagramme pour une pression donnée (Pa, arrondie à l'entier).
+    Les familles étiquetées (HR, enthalpie, volume) sont des couples (valeurs, tableau
+    (n_courbes, N, 2) de points (T, w)) où les points hors graphique valent NaN. Les droites
+    iso-w et isothermes sont données par leurs tableaux d'extrémités. Mis en cache : ne dépend que de la pression."""
+    temps = np.linspace(-10, 50, 100)
+
+    # 1. Courbe de Saturation (100% HR)
+    w_sat = sat_hum_ratio(temps, p_atm)
+
+    # 2. Lignes iso teneurs en eau (w constant), pas 0.001, à droite de la courbe de saturation
+    w_iso = np.arange(0.001, 0.030, 0.001)
+    t_sat = np.interp(w_iso, w_sat, temps)  # T où chaque ligne rencontre la saturation
+    in_range = (t_sat >= -10) & (t_sat < 50)
+    iso_w = (w_iso[in_range], t_sat[in_range])
+
+    # 3. Courbes à humidité relative constante (10%, 20%, ..., 90%)
+    hr_pcts = np.arange(10, 100, 10)
+    with np.errstate(all='ignore'):
+        W = hum_ratio_from_rel_hum(temps[None, :], hr_pcts[:, None] / 100, p_atm)  # (9, 100)
+        W = np.where((W >= 0) & (W <= 0.030), W, np.nan)  # Dans les limites du graphique
+    hr_curves = (hr_pcts, np.stack(np.broadcast_arrays(temps, W), axis=-1))
+
+    # 4. Isothermes sèches (verticales, tous les degrés)
+    t_arr = np.arange(-10, 51)
+    w_max = sat_hum_ratio(t_arr, p_atm)
+    isotherms = (t_arr, w_max)
+
+    # 5. Lignes d'Enthalpie constante (Diagonales)
+    # Formule : w = (h - Cpa*T) / (Hfg + Cpw*T)
+    h_vals = np.arange(-10, 135, 5)
+    denom = 2501 + 1.86 * temps
+    H_w = (h_vals[:, None] - 1.006 * temps) / denom  # (29, 100), toutes les droites d'un coup
+    # Bornes en T : au-dessus de w = 0 et sous la saturation (où la droite est coupée)
+    marges = np.minimum(H_w, w_sat - H_w)
+    t_lo = np.full(len(h_vals), np.nan)
+    t_hi = np.full(len(h_vals), np.nan)
+    for i, marge in enumerate(marges):
+        bornes = _valid_interval(temps, marge)
+        if bornes is not None:
+            t_lo[i], t_hi[i] = bornes
+    T_h = np.linspace(t_lo, t_hi, N_PTS_COURBE, axis=1)
+    W_h = (h_vals[:, None] - 1.006 * T_h) / (2501 + 1.86 * T_h)
+    enthalpy_curves = (h_vals, np.stack((T_h, W_h), axis=-1))
+
+    # 6. Lignes de volume spécifique constant (m³/kg)
+    # Échantillonnage grossier pour borner chaque courbe dans le graphique, puis N_PTS_COURBE
+    # points entre ces bornes (les points hors graphique ne sont plus calculés)
+    w_base = np.linspace(0.001, 0.028, N_PTS_COURBE)
+    v_vals = np.arange(0.80, 0.97, 0.02)
+    with np.errstate(all='ignore'):
+        T_base = t_from_volume_and_hum_ratio(v_vals[:, None], w_base[None, :], p_atm)  # (9, 20)
+    # Saturation évaluée dans la plage du graphique seulement (T bornée par les autres marges)
+    W_sat_base = sat_hum_ratio(np.clip(T_base, -10, 50), p_atm)
+    w_lo = np.full(len(v_vals), np.nan)
+    w_hi = np.full(len(v_vals), np.nan)
+    for i, t_base in enumerate(T_base):
+        # -10 <= T <= 50 et w sous la saturation : intersection des trois intervalles valides
+        bornes = [_valid_interval(w_base, m) for m in (t_base + 10, 50 - t_base, W_sat_base[i] - w_base)]
+        if None not in bornes:
+            lo, hi = max(b[0] for b in bornes), min(b[1] for b in bornes)
+            if lo < hi:
+                w_lo[i], w_hi[i] = lo, hi
+    # w décroissant : T croît le long de chaque courbe, pour un tracé propre
+    W_vol = np.linspace(w_hi, w_lo, N_PTS_COURBE, axis=1)
+    with np.errstate(all='ignore'):
+        T_vol = t_from_volume_and_hum_ratio(v_vals[:, None], W_vol, p_atm)
+    volume_curves = (v_vals, np.stack((T_vol, W_vol), axis=-1))
+
+    return ChartGrids(temps, w_sat, iso_w, hr_curves, isotherms, enthalpy_curves, volume_curves)
+
+class ChartGridsSignals(QObject):
+    """Signal de fin de calcul : (pression arrondie, ChartGrids), reçu dans le thread de l'interface."""
+    finished = Signal(int, object)
+
+class ChartGridsWorker(QRunnable):
+    """Calcule les grilles du diagramme hors du thread de l'interface (calcul numérique pur, sans Qt)."""
+    def __init__(self, p_atm: int, signals: ChartGridsSignals):
+        super().__init__()
+        self.p_atm = p_atm
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(self.p_atm, _compute_chart_grids(self.p_atm))
 
 class PsychroApp(QMainWindow):
     def __init__(self):
@@ -28,7 +146,8 @@ class PsychroApp(QMainWindow):
         # Variables d'état
         self.p_atm = 101325  # Pression au niveau de la mer (Pa)
         self.points_selectionnes = []
-        self.orange_artists = []  # Références aux tracés orange pour pouvoir les effacer
+        self.orange_artists = []  # Références aux textes / marqueurs de processus pour pouvoir les effacer
+        self._bg = None  # Fond statique mémorisé pour le blitting
 
         # --- Interface ---
         main_widget = QWidget()
@@ -84,16 +203,23 @@ class PsychroApp(QMainWindow):
         
         layout.addLayout(sidebar, 1)
 
-        # Zone Graphique
-        self.figure = Figure(figsize=(10, 8), tight_layout=True)
+        # Zone Graphique (DPI écran ; le PNG exporté est rendu à 300 DPI)
+        self.figure = Figure(figsize=(10, 8), tight_layout=True, dpi=100)
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
         layout.addWidget(self.canvas, 4)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
 
         # Initialisation du tracé
         self.setup_chart()
+        self._grids_signals = ChartGridsSignals(self)
+        self._grids_signals.finished.connect(self._on_grids_ready)
         
-        # Événements
+        # Événements (saisies T/HR regroupées : seule la dernière valeur après 50 ms est tracée)
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._do_update_from_inputs)
         self.altitude_in.valueChanged.connect(self.on_altitude_change)
         self.temp_in.valueChanged.connect(self.update_from_inputs)
         self.hr_in.valueChanged.connect(self.update_from_inputs)
@@ -112,92 +238,70 @@ class PsychroApp(QMainWindow):
         """Recalcule la pression, efface les points, et met à jour tout le diagramme."""
         self.p_atm = pression_from_altitude(self.altitude_in.value())
         self.points_selectionnes = []
-        for artist in self.orange_artists:
-            artist.remove()
-        self.orange_artists.clear()
-        self.setup_chart()
-        self.update_from_inputs()
+        # Calcul des grilles en tâche de fond ; le tracé est fait à la réception (_on_grids_ready)
+        QThreadPool.globalInstance().start(ChartGridsWorker(int(round(self.p_atm)), self._grids_signals))
+
+    def _on_grids_ready(self, p_atm: int, grilles: ChartGrids):
+        """Trace les grilles calculées, sauf si l'altitude a changé entre-temps."""
+        if p_atm != int(round(self.p_atm)):
+            return
+        self.points_selectionnes = []
+        self.orange_artists.clear()  # Déjà retirés du graphique par ax.clear() dans _draw_grids
+        self._draw_grids(grilles)
+        self._do_update_from_inputs()
 
     def setup_chart(self):
         """Trace le fond du diagramme (Saturation, Isothermes, Enthalpies)."""
+        self._draw_grids(_compute_chart_grids(int(round(self.p_atm))))
+
+    def _draw_grids(self, grilles: ChartGrids):
+        """Trace les grilles précalculées (thread de l'interface uniquement)."""
         self.ax.clear()
-        temps = np.linspace(-10, 50, 100)
-        
+        # Courbe de saturation conservée pour valider clics / survol par interpolation
+        self._sat_temps, self._sat_w = grilles.temps, grilles.w_sat
+
         # 1. Courbe de Saturation (100% HR)
-        w_sat = [psychrolib.GetSatHumRatio(t, self.p_atm) for t in temps]
-        self.ax.plot(temps, w_sat, color='dimgray', linewidth=1.5, label="Saturation")
+        self.ax.plot(grilles.temps, grilles.w_sat, color='dimgray', linewidth=1.5, label="Saturation")
 
         # 2. Lignes iso teneurs en eau (w constant), pas 0.001, à droite de la courbe de saturation
-        for w_val in np.arange(0.001, 0.030, 0.001):
-            t_sat = np.interp(w_val, w_sat, temps)  # T où la ligne rencontre la saturation
-            if -10 <= t_sat < 50:
-                self.ax.plot([t_sat, 50], [w_val, w_val], color='lightgray', linestyle='-', linewidth=0.8)
+        w_iso, t_sat = grilles.iso_w
+        self.ax.hlines(w_iso, t_sat, 50, colors='lightgray', linestyles='-', linewidths=0.8)
 
         # 3. Courbes à humidité relative constante (10%, 20%, ..., 90%)
-        for hr_pct in range(10, 100, 10):
-            hr = hr_pct / 100
-            w_hr = []
-            t_hr = []
-            for t in temps:
-                try:
-                    w = psychrolib.GetHumRatioFromRelHum(t, hr, self.p_atm)
-                    if 0 <= w <= 0.030:  # Dans les limites du graphique
-                        w_hr.append(w)
-                        t_hr.append(t)
-                except ValueError:
-                    pass
-            if t_hr:
-                self.ax.plot(t_hr, w_hr, 'b--', alpha=0.4, linewidth=1)
-                # Labels au milieu de chaque courbe pour faciliter la lecture
-                mid = len(t_hr) // 2
-                self.ax.text(t_hr[mid], w_hr[mid], f" {hr_pct}%", color='blue', fontsize=7, alpha=0.7,
+        hr_pcts, courbes = grilles.hr_curves
+        for hr_pct, courbe in zip(hr_pcts, courbes):
+            # Labels au milieu de chaque courbe pour faciliter la lecture
+            pts = courbe[~np.isnan(courbe).any(axis=1)]
+            if len(pts):
+                t_mid, w_mid = pts[len(pts) // 2]
+                self.ax.text(t_mid, w_mid, f" {hr_pct}%", color='blue', fontsize=7, alpha=0.7,
                              horizontalalignment='left', verticalalignment='center')
+        self.ax.add_collection(LineCollection(courbes, colors='b', linestyles='--', alpha=0.4, linewidths=1))
 
         # 4. Isothermes sèches (verticales, tous les degrés)
-        for t in range(-10, 51, 1):
-            w_max = psychrolib.GetSatHumRatio(t, self.p_atm)
-            self.ax.plot([t, t], [0, w_max], color='gray', linestyle=':', alpha=0.25)
+        t_arr, w_max = grilles.isotherms
+        self.ax.vlines(t_arr, 0, w_max, colors='gray', linestyles=':', alpha=0.25)
 
         # 5. Lignes d'Enthalpie constante (Diagonales)
-        # Formule : w = (h - Cpa*T) / (Hfg + Cpw*T)
-        for h in range(-10, 135, 5):
-            h_w = [(h - 1.006 * t) / (2501 + 1.86 * t) for t in temps]
-            # On filtre pour rester sous la saturation
-            valid_t = [t for i, t in enumerate(temps) if 0 <= h_w[i] <= w_sat[i]]
-            valid_w = [w for i, w in enumerate(h_w) if 0 <= h_w[i] <= w_sat[i]]
-            if valid_w:
-                self.ax.plot(valid_t, valid_w, 'g--', alpha=0.2)
-                if h <= 100:
-                    # Placer la légende de l'enthalpie à la fin de la courbe (vers la droite / le bas)
-                    # On utilise valid_t[-1] et valid_w[-1] avec un alignement adapté
-                    t_end = valid_t[-1]
-                    w_end = valid_w[-1]
-                    # Si la ligne sort par la droite (T=50), on aligne à droite.
-                    # Sinon la ligne sort par le haut (saturation) -> devrait pas arriver souvent,
-                    # ou sort par le bas (w=0) => T = h/1.006. Le dernier point valide est proche de w=0.
-                    self.ax.text(t_end, w_end, f" {h}", color='green', fontsize=8,
-                                 verticalalignment='bottom', horizontalalignment='left' if t_end < 49 else 'right')
+        h_vals, courbes = grilles.enthalpy_curves
+        for h, courbe in zip(h_vals, courbes):
+            if h <= 100 and not np.isnan(courbe[-1]).any():
+                # Placer la légende de l'enthalpie à la fin de la courbe (vers la droite / le bas)
+                t_end, w_end = courbe[-1]
+                # Si la ligne sort par la droite (T=50), on aligne à droite.
+                # Sinon la ligne sort par le haut (saturation) -> devrait pas arriver souvent,
+                # ou sort par le bas (w=0) => T = h/1.006. Le dernier point valide est proche de w=0.
+                self.ax.text(t_end, w_end, f" {h}", color='green', fontsize=8,
+                             verticalalignment='bottom', horizontalalignment='left' if t_end < 49 else 'right')
+        self.ax.add_collection(LineCollection(courbes, colors='g', linestyles='--', alpha=0.2))
 
         # 6. Lignes de volume spécifique constant (m³/kg)
-        w_vals = np.linspace(0.001, 0.028, 80)
-        for v_m3 in np.arange(0.80, 0.97, 0.02):
-            t_vol = []
-            w_vol = []
-            for w in w_vals:
-                try:
-                    t = psychrolib.GetTDryBulbFromMoistAirVolumeAndHumRatio(v_m3, w, self.p_atm)
-                    w_sat_t = psychrolib.GetSatHumRatio(t, self.p_atm)
-                    if -10 <= t <= 50 and 0 <= w <= 0.030 and w <= w_sat_t:
-                        t_vol.append(t)
-                        w_vol.append(w)
-                except ValueError:
-                    pass
-            if t_vol:
-                # Trier par T pour un tracé propre
-                pts = sorted(zip(t_vol, w_vol))
-                t_vol, w_vol = [p[0] for p in pts], [p[1] for p in pts]
-                self.ax.plot(t_vol, w_vol, 'm:', alpha=0.35, linewidth=1)
-                self.ax.text(t_vol[0], w_vol[0], f" {v_m3:.2f}", color='magenta', fontsize=7, alpha=0.7)
+        v_vals, courbes = grilles.volume_curves
+        for v_m3, courbe in zip(v_vals, courbes):
+            pts = courbe[~np.isnan(courbe).any(axis=1)]
+            if len(pts):
+                self.ax.text(pts[0, 0], pts[0, 1], f" {v_m3:.2f}", color='magenta', fontsize=7, alpha=0.7)
+        self.ax.add_collection(LineCollection(courbes, colors='m', linestyles=':', alpha=0.35, linewidths=1))
 
         self.ax.set_xlim(-10, 50)
         self.ax.set_ylim(0, 0.030)
@@ -226,9 +330,24 @@ class PsychroApp(QMainWindow):
                                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.8, edgecolor='gray'))
         self.hover_text.set_visible(False)
 
+        # Point courant : animé, redessiné seul par blitting au-dessus du fond mémorisé
+        self.current_marker = self.ax.scatter([], [], color='blue', s=80, edgecolors='white', zorder=5,
+                                              animated=True)
+
+        # Points cliqués et lignes de processus : artistes uniques, mis à jour en place
+        self._click_points = []
+        self.click_marker = self.ax.scatter([], [], color='orange', s=40)
+        self._process_segments = []
+        self._process_colors = []
+        self.process_lines = self.ax.add_collection(LineCollection([], linewidths=2, linestyles='-', zorder=2))
+
         self.canvas.draw()
 
     def update_from_inputs(self):
+        """Relance le délai d'attente : le point n'est retracé qu'une fois la saisie stabilisée."""
+        self._update_timer.start()
+
+    def _do_update_from_inputs(self):
         t = self.temp_in.value()
         hr = self.hr_in.value()
         try:
@@ -240,10 +359,20 @@ class PsychroApp(QMainWindow):
             self.log_box.setText("ERREUR : Point hors limites physiques !")
 
     def plot_point(self, t, w):
-        if hasattr(self, 'current_marker'):
-            self.current_marker.remove()
-        self.current_marker = self.ax.scatter(t, w, color='blue', s=80, edgecolors='white', zorder=5)
-        self.canvas.draw()
+        self.current_marker.set_offsets([[t, w]])
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.current_marker)
+        self.canvas.blit(self.ax.bbox)
+
+    def on_draw(self, event):
+        """Mémorise le fond statique après chaque rendu complet et y replace le point courant."""
+        if self.figure.canvas.is_saving():  # Rendu d'export (autre DPI / autre backend)
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.current_marker)
 
     def on_mouse_move(self, event):
         if hasattr(self, 'hover_text'):
@@ -251,7 +380,7 @@ class PsychroApp(QMainWindow):
                 t, w = event.xdata, event.ydata
                 # Vérification : Seulement sous la courbe de saturation et limites physiquement vraisemblables
                 if -15 <= t <= 55 and w >= 0:
-                    sat_w = psychrolib.GetSatHumRatio(t, self.p_atm)
+                    sat_w = np.interp(t, self._sat_temps, self._sat_w)
                     if w <= sat_w:
                         h = psychrolib.GetMoistAirEnthalpy(t, w)
                         p_hpa = self.p_atm / 100.0
@@ -270,10 +399,10 @@ class PsychroApp(QMainWindow):
         if event.inaxes:
             t, w = event.xdata, event.ydata
             # Vérifier si le clic est sous la courbe de saturation
-            if w <= psychrolib.GetSatHumRatio(t, self.p_atm):
+            if w <= np.interp(t, self._sat_temps, self._sat_w):
                 self.points_selectionnes.append((t, w))
-                sc = self.ax.scatter(t, w, color='orange', s=40)
-                self.orange_artists.append(sc)
+                self._click_points.append((t, w))
+                self.click_marker.set_offsets(self._click_points)
                 
                 if len(self.points_selectionnes) == 2:
                     self.calculer_processus()
@@ -287,12 +416,12 @@ class PsychroApp(QMainWindow):
         delta_h = (h2 - h1) / 1000 # kJ/kg
         
         # Tracé de la ligne de processus
-        line, = self.ax.plot([p1[0], p2[0]], [p1[1], p2[1]], 'orange', lw=2, linestyle='-')
+        self.add_process_line(p1, p2, 'orange')
         # Ajout des lettres A et B au-dessus des points (décalage vertical pour lisibilité)
         off_y = 0.0005 
         text_a = self.ax.text(p1[0], p1[1] + off_y, 'A', color='black', fontsize=10, fontweight='bold', ha='center')
         text_b = self.ax.text(p2[0], p2[1] + off_y, 'B', color='black', fontsize=10, fontweight='bold', ha='center')
-        self.orange_artists.extend([line, text_a, text_b])
+        self.orange_artists.extend([text_a, text_b])
         
         msg = (f"NOUVEAU PROCESSUS :\n"
                f"Point A -> Point B\n"
@@ -300,6 +429,13 @@ class PsychroApp(QMainWindow):
                f"Puissance pour 1 kg/s : {delta_h:.2f} kW")
         self.log_box.append("\n" + "-"*20 + "\n" + msg)
 
+    def add_process_line(self, p1, p2, couleur):
+        """Ajoute un segment de processus à la collection existante (sans créer de nouvel artiste)."""
+        self._process_segments.append([p1, p2])
+        self._process_colors.append(couleur)
+        self.process_lines.set_segments(self._process_segments)
+        self.process_lines.set_colors(self._process_colors)
+
     def calculer_batterie_froide(self):
         t_A = self.temp_in.value()
         hr_A = self.hr_in.value()
@@ -328,9 +464,9 @@ class PsychroApp(QMainWindow):
             delta_w = (w_B - w_A) * 1000.0 # g/kg
             
             # Tracé
-            line, = self.ax.plot([t_A, t_B], [w_A, w_B], 'cyan', lw=2, linestyle='-')
+            self.add_process_line((t_A, w_A), (t_B, w_B), 'cyan')
             sc = self.ax.scatter(t_B, w_B, color='cyan', s=60, edgecolors='black', zorder=6)
-            self.orange_artists.extend([line, sc])
+            self.orange_artists.append(sc)
             
             msg = (f"BATTERIE FROIDE :\n"
                    f"Entrée : T={t_A:.1f}°C, HR={hr_A:.1f}%\n"
@@ -352,8 +488,13 @@ class PsychroApp(QMainWindow):
             except (ValueError, AttributeError):
                 pass
         self.orange_artists.clear()
+        self._click_points.clear()
+        self.click_marker.set_offsets(np.empty((0, 2)))
+        self._process_segments.clear()
+        self._process_colors.clear()
+        self.process_lines.set_segments([])
         self.log_box.clear()
-        self.update_from_inputs()  # Restaure l'affichage du point manuel actuel
+        self._do_update_from_inputs()  # Restaure l'affichage du point manuel actuel
         self.canvas.draw()
 
     def exporter_graphique(self, format_fichier: str):
@@ -369,9 +510,8 @@ class PsychroApp(QMainWindow):
             filtres[format_fichier]
         )
         if chemin:
-            opts = {'format': format_fichier, 'bbox_inches': 'tight'}
-            if format_fichier == 'png':
-                opts['dpi'] = 300
+            # 300 DPI : résolution du PNG, et des éventuels éléments rasterisés en SVG/PDF
+            opts = {'format': format_fichier, 'bbox_inches': 'tight', 'dpi': 300}
             self.figure.savefig(chemin, **opts)
 
 if __name__ == "__main__":